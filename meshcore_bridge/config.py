@@ -1,12 +1,16 @@
 """Configuration loading and validation."""
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MqttConfig:
     broker: str
     port: int = 1883
@@ -15,18 +19,18 @@ class MqttConfig:
     topic: str = "meshcore/bridge"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NodeConfig:
     id: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SerialConfig:
     port: str
     baud: int = 115200
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     mqtt: MqttConfig
     node: NodeConfig
@@ -34,9 +38,9 @@ class Config:
 
 
 def load_config(path: Path) -> Config:
-    """Load and validate configuration from YAML file."""
-    with open(path) as f:
-        raw = yaml.safe_load(f)
+    """Load and validate configuration from TOML file."""
+    with open(path, "rb") as f:
+        raw = tomllib.load(f)
 
     errors = []
 
@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 # Initial connection retry settings
 INITIAL_RETRY_DELAY = 5  # seconds
 
+# Upper bound on how long the main loop waits for serial packets
+READ_TIMEOUT = 1  # seconds
+
 
 def main() -> None:
     """Entry point for meshcore-bridge command."""
@@ -28,8 +31,8 @@ def main() -> None:
         "-c",
         "--config",
         type=Path,
-        default=Path("config.yaml"),
-        help="Path to configuration file (default: config.yaml)",
+        default=Path("config.toml"),
+        help="Path to configuration file (default: config.toml)",
     )
     parser.add_argument(
         "-v",
@@ -73,6 +76,7 @@ def run(config) -> None:
         nonlocal shutdown_requested
         logger.info("Shutdown requested")
         shutdown_requested = True
+        serial_handler.cancel_read()
 
     signal.signal(signal.SIGINT, handle_signal)
     signal.signal(signal.SIGTERM, handle_signal)
@@ -102,7 +106,7 @@ def run(config) -> None:
             config.mqtt.topic,
         )
 
-        # Main loop: poll serial, forward to MQTT
+        # Main loop: wait for serial data, forward to MQTT
         while not shutdown_requested:
             if not serial_handler.connected:
                 # Attempt reconnection
@@ -111,7 +115,7 @@ def run(config) -> None:
                 continue
 
             try:
-                packets = serial_handler.read_packets()
+                packets = serial_handler.read_packets(timeout=READ_TIMEOUT)
                 for packet in packets:
                     mqtt_handler.publish_packet(packet)
             except SerialDisconnected:
@@ -13,6 +13,10 @@ logger = logging.getLogger(__name__)
 RECONNECT_DELAY_MIN = 1  # seconds
 RECONNECT_DELAY_MAX = 120  # seconds
 
+# Publish settings: packets are fire-and-forget, the mesh handles loss
+PUBLISH_QOS = 0
+MAX_INFLIGHT_MESSAGES = 20
+
 
 class MqttHandler:
     """Handles MQTT communication for mesh bridging."""
@@ -27,15 +31,23 @@ class MqttHandler:
         self._node_id = node_id
         self._on_packet = on_packet
         self._connected = False
+        # Topic for publishing and subscribing, resolved once for the hot path
+        self._topic = config.topic
 
         client_id = f"mc-bridge-{node_id}"
-        self._client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id=client_id)
+        # MQTT v5 is required for the no-local subscription option
+        self._client = mqtt.Client(
+            mqtt.CallbackAPIVersion.VERSION2,
+            client_id=client_id,
+            protocol=mqtt.MQTTv5,
+        )
         self._client.on_connect = self._handle_connect
         self._client.on_disconnect = self._handle_disconnect
         self._client.on_message = self._handle_message
 
         # Enable automatic reconnection with exponential backoff
         self._client.reconnect_delay_set(RECONNECT_DELAY_MIN, RECONNECT_DELAY_MAX)
+        self._client.max_inflight_messages_set(MAX_INFLIGHT_MESSAGES)
 
         if config.username:
             self._client.username_pw_set(config.username, config.password)
@@ -45,11 +57,6 @@ class MqttHandler:
         """Return True if currently connected to broker."""
         return self._connected
 
-    @property
-    def _topic(self) -> str:
-        """Topic for publishing and subscribing."""
-        return self._config.topic
-
     def connect(self) -> None:
         """Connect to MQTT broker and start network loop."""
         logger.info(
@@ -69,11 +76,15 @@ class MqttHandler:
     def publish_packet(self, payload: bytes) -> None:
         """Publish a packet received from local serial to MQTT."""
         if not self._connected:
-            logger.debug("Cannot publish: not connected to MQTT broker")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Cannot publish: not connected to MQTT broker")
             return
 
-        self._client.publish(self._topic, payload)
-        logger.debug("Published packet to %s: %d bytes", self._topic, len(payload))
+        self._client.publish(self._topic, payload, qos=PUBLISH_QOS, retain=False)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Published packet to %s: %d bytes", self._topic, len(payload)
+            )
 
     def _handle_connect(
         self,
@@ -86,7 +97,11 @@ class MqttHandler:
         if reason_code == 0:
             self._connected = True
             logger.info("Connected to MQTT broker")
-            client.subscribe(self._topic)
+            # No-local: the broker does not echo our own publishes back
+            client.subscribe(
+                self._topic,
+                options=mqtt.SubscribeOptions(qos=PUBLISH_QOS, noLocal=True),
+            )
             logger.info("Subscribed to %s", self._topic)
         else:
             self._connected = False
@@ -119,8 +134,9 @@ class MqttHandler:
         if not payload:
             return
 
-        logger.debug(
-            "Received packet: %d bytes",
-            len(payload),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Received packet: %d bytes",
+                len(payload),
+            )
         self._on_packet(payload)
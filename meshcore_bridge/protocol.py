@@ -9,30 +9,104 @@ Frame format:
 - Checksum: Fletcher-16 over payload only, 2 bytes big-endian
 """
 
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional speedup
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional speedup
+    njit = None
+
 FRAME_MAGIC = b"\xc0\x3e"
 HEADER_SIZE = 4  # magic (2) + length (2)
 CHECKSUM_SIZE = 2
 
+_HEADER = struct.Struct("!2sH")
+_CHECKSUM = struct.Struct("!H")
+
+# Consumed bytes kept at the head of the decoder buffer before compacting
+COMPACT_THRESHOLD = 4096
+
+# Below this size the numpy setup cost outweighs the vectorized sums
+NUMPY_MIN_SIZE = 16
+
+# Largest block whose running sums fit in 32 bits before reducing mod 255
+# (RFC 1146); both implementations defer the modulo to block boundaries.
+FLETCHER_BLOCK_SIZE = 5802
 
-def fletcher16(data: bytes) -> int:
-    """Calculate Fletcher-16 checksum over data."""
+
+def _fletcher16_py(data: bytes) -> int:
+    """Calculate Fletcher-16 checksum over data (pure Python)."""
+    view = memoryview(data)
+    sum1, sum2 = 0, 0
+    for i in range(0, len(view), FLETCHER_BLOCK_SIZE):
+        for b in view[i : i + FLETCHER_BLOCK_SIZE]:
+            sum1 += b
+            sum2 += sum1
+        sum1 %= 255
+        sum2 %= 255
+    return (sum2 << 8) | sum1
+
+
+def _fletcher16_np(data: bytes) -> int:
+    """Calculate Fletcher-16 checksum over data (numpy)."""
+    view = memoryview(data)
     sum1, sum2 = 0, 0
-    for b in data:
-        sum1 = (sum1 + b) % 255
-        sum2 = (sum2 + sum1) % 255
+    for i in range(0, len(view), FLETCHER_BLOCK_SIZE):
+        block = np.frombuffer(view[i : i + FLETCHER_BLOCK_SIZE], dtype=np.uint8)
+        s1 = block.cumsum(dtype=np.uint32)
+        sum2 = (sum2 + len(block) * sum1 + int(s1.sum(dtype=np.uint32))) % 255
+        sum1 = (sum1 + int(s1[-1])) % 255
     return (sum2 << 8) | sum1
 
 
-def encode_frame(payload: bytes) -> bytes:
+if njit is not None:
+
+    @njit(cache=True, boundscheck=False)
+    def _fletcher16_jit(data):
+        """Calculate Fletcher-16 checksum over a uint8 array (numba)."""
+        n = data.shape[0]
+        sum1, sum2 = 0, 0
+        for start in range(0, n, FLETCHER_BLOCK_SIZE):
+            for i in range(start, min(start + FLETCHER_BLOCK_SIZE, n)):
+                sum1 += data[i]
+                sum2 += sum1
+            sum1 %= 255
+            sum2 %= 255
+        return (sum2 << 8) | sum1
+
+
+try:
+    from ._checksum import fletcher16
+except ImportError:  # compiled extension not built, use the best fallback
+    if njit is not None:
+
+        def fletcher16(data: bytes) -> int:
+            """Calculate Fletcher-16 checksum over data."""
+            return _fletcher16_jit(np.frombuffer(data, dtype=np.uint8))
+
+    else:
+
+        def fletcher16(data: bytes) -> int:
+            """Calculate Fletcher-16 checksum over data."""
+            if np is None or len(data) < NUMPY_MIN_SIZE:
+                return _fletcher16_py(data)
+            return _fletcher16_np(data)
+
+
+def encode_frame(payload: bytes) -> bytearray:
     """Encode a payload into a framed packet."""
     length = len(payload)
     checksum = fletcher16(payload)
-    return (
-        FRAME_MAGIC
-        + length.to_bytes(2, "big")
-        + payload
-        + checksum.to_bytes(2, "big")
-    )
+    frame = bytearray(HEADER_SIZE + length + CHECKSUM_SIZE)
+    _HEADER.pack_into(frame, 0, FRAME_MAGIC, length)
+    frame[HEADER_SIZE : HEADER_SIZE + length] = payload
+    _CHECKSUM.pack_into(frame, HEADER_SIZE + length, checksum)
+    return frame
 
 
 class FrameDecoder:
@@ -40,6 +114,8 @@ class FrameDecoder:
 
     def __init__(self) -> None:
         self._buffer = bytearray()
+        # Consumed bytes are skipped by offset and compacted in bulk
+        self._read_pos = 0
 
     def feed(self, data: bytes) -> list[bytes]:
         """Feed bytes into decoder, return list of complete payloads."""
@@ -48,47 +124,53 @@ class FrameDecoder:
 
         while True:
             # Look for magic bytes
-            try:
-                start = self._buffer.index(FRAME_MAGIC[0])
-            except ValueError:
-                self._buffer.clear()
+            start = self._buffer.find(FRAME_MAGIC, self._read_pos)
+            if start < 0:
+                # Keep a trailing first magic byte, the rest may follow later
+                if (
+                    len(self._buffer) > self._read_pos
+                    and self._buffer[-1] == FRAME_MAGIC[0]
+                ):
+                    del self._buffer[:-1]
+                else:
+                    self._buffer.clear()
+                self._read_pos = 0
                 break
 
             # Discard bytes before magic
-            if start > 0:
-                del self._buffer[:start]
-
-            # Check for complete magic
-            if len(self._buffer) < 2:
-                break
-            if self._buffer[1] != FRAME_MAGIC[1]:
-                # False positive, skip this byte
-                del self._buffer[:1]
-                continue
+            self._read_pos = start
+            available = len(self._buffer) - start
 
             # Need full header to get length
-            if len(self._buffer) < HEADER_SIZE:
+            if available < HEADER_SIZE:
                 break
 
-            length = (self._buffer[2] << 8) | self._buffer[3]
+            length = (self._buffer[start + 2] << 8) | self._buffer[start + 3]
             frame_size = HEADER_SIZE + length + CHECKSUM_SIZE
 
             # Wait for complete frame
-            if len(self._buffer) < frame_size:
+            if available < frame_size:
                 break
 
-            # Extract and validate
-            payload = bytes(self._buffer[HEADER_SIZE : HEADER_SIZE + length])
+            # Validate in place, copying the payload out only if it is good
+            payload_start = start + HEADER_SIZE
+            payload_end = payload_start + length
             received_checksum = (
-                self._buffer[HEADER_SIZE + length] << 8
-            ) | self._buffer[HEADER_SIZE + length + 1]
-
-            expected_checksum = fletcher16(payload)
-            if received_checksum == expected_checksum:
-                frames.append(payload)
-            # else: checksum mismatch, discard frame silently
-
-            # Remove processed frame
-            del self._buffer[:frame_size]
+                self._buffer[payload_end] << 8
+            ) | self._buffer[payload_end + 1]
+
+            with memoryview(self._buffer)[payload_start:payload_end] as payload:
+                expected_checksum = fletcher16(payload)
+                if received_checksum == expected_checksum:
+                    frames.append(bytes(payload))
+                # else: checksum mismatch, discard frame silently
+
+            # Skip past processed frame
+            self._read_pos += frame_size
+
+        # Compact once enough consumed bytes have accumulated
+        if self._read_pos > COMPACT_THRESHOLD:
+            del self._buffer[: self._read_pos]
+            self._read_pos = 0
 
         return frames
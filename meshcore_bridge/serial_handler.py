@@ -1,10 +1,14 @@
 """Serial port handler for MeshCore RS232 bridge."""
 
 import logging
+import os
+import queue
+import select
 import threading
 import time
 
 import serial
+import serial.threaded
 
 from .config import SerialConfig
 from .protocol import FrameDecoder, encode_frame
@@ -15,6 +19,80 @@ logger = logging.getLogger(__name__)
 RECONNECT_DELAY_MIN = 1  # seconds
 RECONNECT_DELAY_MAX = 60  # seconds
 
+# Maximum bytes drained from the port per read on POSIX
+READ_CHUNK_SIZE = 4096
+
+
+class BridgeProtocol(serial.threaded.Protocol):
+    """Decodes frames on the serial reader thread and queues their payloads."""
+
+    def __init__(self, packets: queue.SimpleQueue[bytes | None]) -> None:
+        self._packets = packets
+        self._decoder = FrameDecoder()
+
+    def data_received(self, data: bytes) -> None:
+        for pkt in self._decoder.feed(data):
+            self._packets.put(pkt)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if exc is not None:
+            logger.error("Serial read error: %s", exc)
+        # Wake read_packets() so the main loop notices the reader stopped
+        self._packets.put(None)
+
+
+class BridgeReaderThread(serial.threaded.ReaderThread):
+    """
+    Reader thread that drains the port with one os.read() per wakeup.
+
+    pyserial's read loop issues an in_waiting ioctl plus a read of at most
+    that many bytes each time; on POSIX this waits on the port and its
+    cancel pipe directly and reads up to READ_CHUNK_SIZE bytes at once.
+    Other platforms use the stock pyserial loop.
+    """
+
+    def run(self) -> None:
+        if os.name != "posix":
+            super().run()
+            return
+
+        self.protocol = self.protocol_factory()
+        self.protocol.connection_made(self)
+        self._connection_made.set()
+
+        # pyserial opens the port non-blocking and wakes readers via this pipe
+        fd = self.serial.fileno()
+        abort_fd = self.serial.pipe_abort_read_r
+        error = None
+        while self.alive and self.serial.is_open:
+            try:
+                ready, _, _ = select.select([fd, abort_fd], [], [])
+                if abort_fd in ready:
+                    os.read(abort_fd, 1000)
+                    continue
+                data = os.read(fd, READ_CHUNK_SIZE)
+            except BlockingIOError:
+                continue
+            except OSError as e:
+                error = serial.SerialException(f"read failed: {e}")
+                break
+
+            if not data:
+                error = serial.SerialException(
+                    "device reports readiness to read but returned no data"
+                )
+                break
+
+            try:
+                self.protocol.data_received(data)
+            except Exception as e:
+                error = e
+                break
+
+        self.alive = False
+        self.protocol.connection_lost(error)
+        self.protocol = None
+
 
 class SerialHandler:
     """Handles serial communication with MeshCore device."""
@@ -22,22 +100,34 @@ class SerialHandler:
     def __init__(self, config: SerialConfig) -> None:
         self._config = config
         self._port: serial.Serial | None = None
-        self._decoder = FrameDecoder()
+        self._reader: BridgeReaderThread | None = None
+        # SimpleQueue.put() is reentrant, so cancel_read() is signal-safe
+        self._packets: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
         self._write_lock = threading.Lock()
         self._reconnect_delay = RECONNECT_DELAY_MIN
 
     @property
     def connected(self) -> bool:
-        """Return True if serial port is open."""
-        return self._port is not None and self._port.is_open
+        """Return True if serial port is open and being read."""
+        return (
+            self._port is not None
+            and self._port.is_open
+            and self._reader is not None
+            and self._reader.alive
+        )
 
     def open(self) -> None:
-        """Open the serial port."""
+        """Open the serial port and start the reader thread."""
         self._port = serial.Serial(
             port=self._config.port,
             baudrate=self._config.baud,
-            timeout=0.1,  # 100ms read timeout for polling
+            timeout=None,  # reader thread blocks until data arrives
+        )
+        self._reader = BridgeReaderThread(
+            self._port,
+            lambda: BridgeProtocol(self._packets),
         )
+        self._reader.start()
         self._reconnect_delay = RECONNECT_DELAY_MIN  # Reset backoff on success
         logger.info(
             "Opened serial port %s at %d baud",
@@ -46,9 +136,10 @@ class SerialHandler:
         )
 
     def close(self) -> None:
-        """Close the serial port."""
-        if self._port and self._port.is_open:
-            self._port.close()
+        """Stop the reader thread and close the serial port."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
             logger.info("Closed serial port")
         self._port = None
 
@@ -60,7 +151,6 @@ class SerialHandler:
         Uses exponential backoff between attempts.
         """
         self.close()
-        self._decoder = FrameDecoder()  # Reset decoder state
 
         logger.info(
             "Attempting serial reconnection in %d seconds...",
@@ -80,28 +170,37 @@ class SerialHandler:
             )
             return False
 
-    def read_packets(self) -> list[bytes]:
+    def cancel_read(self) -> None:
+        """Wake a read_packets() call blocked waiting for packets."""
+        self._packets.put(None)
+
+    def read_packets(self, timeout: float | None = None) -> list[bytes]:
         """
-        Read and decode any available packets.
+        Wait for packets decoded by the reader thread.
 
-        Returns list of decoded payloads, or empty list if no data or error.
+        Blocks until a packet arrives, cancel_read() is called or timeout
+        seconds pass, then returns every packet queued so far.
         Raises SerialDisconnected if the port is no longer available.
         """
-        if not self.connected:
+        if self._reader is None:
             return []
 
+        packets = []
         try:
-            data = self._port.read(self._port.in_waiting or 1)
-        except serial.SerialException as e:
-            logger.error("Serial read error: %s", e)
-            raise SerialDisconnected() from e
-
-        if not data:
-            return []
-
-        packets = self._decoder.feed(data)
-        for pkt in packets:
-            logger.debug("Received packet from serial: %d bytes", len(pkt))
+            pkt = self._packets.get(timeout=timeout)
+            while True:
+                if pkt is not None:
+                    packets.append(pkt)
+                pkt = self._packets.get_nowait()
+        except queue.Empty:
+            pass
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for pkt in packets:
+                logger.debug("Received packet from serial: %d bytes", len(pkt))
+
+        if not packets and not self._reader.alive:
+            raise SerialDisconnected()
         return packets
 
     def write_packet(self, payload: bytes) -> None:
@@ -114,7 +213,8 @@ class SerialHandler:
         try:
             with self._write_lock:
                 self._port.write(frame)
-            logger.debug("Sent packet to serial: %d bytes", len(payload))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent packet to serial: %d bytes", len(payload))
         except serial.SerialException as e:
             logger.error("Serial write error: %s", e)
             # Don't raise here - let the main loop detect via read_packets
@@ -0,0 +1,11 @@
+"""Build configuration for the optional compiled checksum extension."""
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+ext_modules = cythonize("meshcore_bridge/_checksum.pyx")
+for ext in ext_modules:
+    # Fall back to the pure-Python checksum when no C compiler is available
+    ext.optional = True
+
+setup(ext_modules=ext_modules)